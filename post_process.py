@@ -15,10 +15,108 @@
     on the extracted information
 """
 import os
-import numpy as np
+import mmap
 import struct
+import numpy as np
 import time
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional, without it the dump layout is walked in pure python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _read_word(words, p):
+    """Return the 4 byte packet at index p as an int, checking it is in the file
+    """
+    if p < 0 or p >= len(words):
+        raise IndexError("read past the end of the ppf file")
+    return np.int64(words[p])
+
+
+@njit(cache=True)
+def _parse_dump(words, off):
+    """Walk the integer fields of a single dump 
+
+    Follows the record layout of Appendix IV in the Hyades user guide, reading 
+    the array lengths, header integers and material element counts, and 
+    noting the packet offset of every other field so it can be read directly 
+    from the buffer. Post processor arrays are not walked, their sizes depend 
+    on the array names.
+
+    Args
+    ----
+    words (numpy array [uint32]) : contents of the binary file as 4 byte packets
+    off (int) : packet index of the start of the dump
+
+    Returns
+    -------
+    lengths [int] : NGRPMXX, NIONMXX, NLVLMXX, NMATMXX, NPPARMXX, NTNPARTMXX, 
+        NTNREACMXX, NRMAXX, NZMAXX
+    header [int] : NCYCL, IALPHA, NREG, NZONE, NGROUP, NPPARY
+    elements [int] : number of elements in each region
+    materials [int] : packet offset of the element data for each region
+    offsets [int] : packet offset of each field in PPFDump.LAYOUT
+    """
+    lengths = np.empty(9, dtype=np.int64)
+    header = np.empty(6, dtype=np.int64)
+    offsets = np.empty(13, dtype=np.int64)
+
+    p = off + 1
+    for i in range(9):
+        lengths[i] = _read_word(words, p + i)
+    # Unsure why the 2 packets after the lengths are necessary
+    p += 9 + 2
+
+    offsets[0] = p # NAMEP
+    offsets[1] = p + 8 # TBUF
+    offsets[2] = p + 10 # DBUF
+    offsets[3] = p + 13 # IVER1
+    offsets[4] = p + 15 # IVER2
+    offsets[5] = p + 17 # MACHNE
+    offsets[6] = p + 19 # TIME
+    p += 21
+
+    # NCYCL, IALPHA, NREG, NZONE, NGROUP
+    for i in range(5):
+        header[i] = _read_word(words, p + i)
+    p += 5 + 5
+    header[5] = _read_word(words, p) # NPPARY
+    p += 1 + 8
+
+    offsets[7] = p # CPPBUF
+    p += 2*lengths[4]
+    offsets[8] = p # PHGRPBND
+    p += lengths[0]
+    offsets[9] = p # PHGRPCEN
+    p += lengths[0]
+
+    # Might be 2 4byte buffer, and 1 4 byte package belongs to PHGRPBND
+    p += 3
+    offsets[10] = p # IREG
+    p += header[3] + 1
+
+    nreg = header[2]
+    if nreg > len(words):
+        raise IndexError("read past the end of the ppf file")
+    elements = np.empty(nreg, dtype=np.int64)
+    materials = np.empty(nreg, dtype=np.int64)
+    for region in range(nreg):
+        elements[region] = _read_word(words, p)
+        materials[region] = p + 1
+        p += 1 + 6*elements[region]
+
+    offsets[11] = p # GLOBALS
+    p += 48*2 + 2
+    offsets[12] = p # PARRAYS
+
+    return lengths, header, elements, materials, offsets
+
 class PPF:
     """Wrapper class to read in .ppf hyades file
 
@@ -53,6 +151,12 @@ class PPF:
     def read_ppf(self, path, debug=False):
         """Read the supplied ppf file
 
+        The first dump is read to find the problem size, then the start of every
+        other dump is found by walking only its layout. The remaining dumps are
+        then read from those layouts, and their arrays copied into the storage 
+        shared by all dumps, which is sized up front from the number of dumps 
+        found.
+
         ARGS
         ----
         path (str) : absolute or relative path to hyades .ppf file to be read
@@ -64,25 +168,175 @@ class PPF:
         >>> dmps.read_ppf("hyades_run.ppf")
         """
 
-        f = open(path, "rb")
-        f_size = os.path.getsize(path)
+        buf = self._load(path)
+        f_size = len(buf)
 
-        # Attempt to read in a "dump" until the end of the file is reached
+        # Attempt to find a "dump" until the end of the file is reached
         self.dumps = []
-        while f.tell() < f_size:
+        self._pmatrix = {}
+        self._parray_packets = None
+        starts = []
+        layouts = []
+        start = 0
+        while start < f_size:
             try:
-                self.dumps.append(PPFDump(f))
-            except Exception as e:
-                print("Something has failed with reading in the ppf file, \n \
-                        breaking at {}/{}".format(f.tell(), f_size))
-                print("To run in debug mode, pass debug = True to PPF class")
-                if debug:
-                    raise e
+                if not self.dumps:
+                    cursor = [start]
+                    self.dumps.append(PPFDump(buf, cursor))
+                    end = cursor[0]
+                    # NZONE is fixed for the run, so the array sizes are too
+                    self._parray_packets = PPFDump.parray_packets(
+                            self.dumps[0].NZONE)
                 else:
-                    break
-            f.seek(4, 1) # fast forward to the next dump
+                    end, layout = PPFDump.find_end(buf, start, 
+                            self._parray_packets)
+                    starts.append(start)
+                    layouts.append(layout)
+            except Exception as e:
+                self._read_failed(e, start, f_size, debug)
+                break
+            start = end + 4 # fast forward to the next dump
+
+        self._ireg = None
+        self._globals = None
+        if self.dumps:
+            self._allocate_storage(1 + len(starts))
+
+        for column, (start, layout) in enumerate(zip(starts, layouts), 1):
+            try:
+                dump = PPFDump(buf, [start], layout, self._parray_packets)
+                self._store(dump, column)
+            except Exception as e:
+                self._read_failed(e, start, f_size, debug)
+                break
+            self.dumps.append(dump)
+
+        # Drop the storage allocated for dumps that failed to read. It is shared 
+        # by every dump, so make it read only
+        for name, matrix in self._pmatrix.items():
+            self._pmatrix[name] = matrix[:, :len(self.dumps)]
+            self._pmatrix[name].flags.writeable = False
+        for dump in self.dumps:
+            for array in dump.parrays.values():
+                array.flags.writeable = False
+        if self.dumps:
+            self._ireg = self._ireg[:len(self.dumps)]
+            self._globals = self._globals[:len(self.dumps)]
+            self._ireg.flags.writeable = False
+            self._globals.flags.writeable = False
+            for dump in self.dumps:
+                dump.IREG.flags.writeable = False
+                dump.global_variables.flags.writeable = False
+
+        # Dumps do not change after parsing, so the times only need collecting once
+        self._times = np.fromiter((dump.TIME for dump in self.dumps), 
+                dtype=np.float64, count=len(self.dumps))
+        # tidx relies on the cached times, so they can't be changed in place
+        self._times.flags.writeable = False
+
+    @staticmethod
+    def _load(path):
+        """Return the contents of a ppf file as a buffer
+
+        The file is memory mapped rather than read in, every array kept on a 
+        dump is copied out of the map, which is released once the last view 
+        into it is dropped. Files that can't be mapped are read into a 
+        preallocated buffer in as few reads as possible.
+
+        Args
+        ----
+        path (str) : absolute or relative path to hyades .ppf file to be read
+
+        Returns
+        -------
+        buffer : mmap, or bytes like contents of the file
+        """
+        with open(path, "rb", buffering=0) as f:
+            f_size = os.fstat(f.fileno()).st_size
+            if not f_size:
+                # Nothing to map, e.g. an empty file or a pipe
+                return f.readall()
 
-        f.close()
+            try:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+
+            buf = bytearray(f_size)
+            with memoryview(buf) as view:
+                n = 0
+                while n < f_size:
+                    read = f.readinto(view[n:])
+                    if not read:
+                        break
+                    n += read
+            del buf[n:]
+            return buf
+
+    def _read_failed(self, error, position, f_size, debug):
+        """Report a dump that could not be read, reraising it in debug mode
+
+        Args
+        ----
+        error (Exception) : error raised while reading the dump
+        position (int) : byte offset of the start of the dump
+        f_size (int) : size of the file in bytes
+        debug (bool) : reraise the error
+        """
+        print("Something has failed with reading in the ppf file, \n \
+                breaking at {}/{}".format(position, f_size))
+        print("To run in debug mode, pass debug = True to PPF class")
+        if debug:
+            raise error
+
+    def _allocate_storage(self, capacity):
+        """Allocate the storage shared by all dumps
+
+        Each global array is stored as one (zones, capacity) matrix, with a 
+        column per dump, left as nan for any dump that does not contain the 
+        array. The region numbers and global variables are stored as 
+        one (capacity, n) matrix each, with a row per dump, so sweeping a value 
+        across dumps reads contiguous memory. The dumps read so far are stored
+        with _store.
+
+        Args
+        ----
+        capacity (int) : number of dumps to make room for
+        """
+        first = self.dumps[0]
+
+        for name, array in first.parrays.items():
+            self._pmatrix[name] = np.full((array.shape[0], capacity), np.nan)
+        self._ireg = np.empty((capacity, first.IREG.shape[0]), 
+                dtype=first.IREG.dtype)
+        self._globals = np.empty((capacity, first.global_variables.shape[0]), 
+                dtype=np.float64)
+
+        for column, dump in enumerate(self.dumps):
+            self._store(dump, column)
+
+    def _store(self, dump, column):
+        """Copy the arrays of a dump into the shared storage, and replace them 
+        with views of it
+
+        Global arrays not found in the first dump are left on the dump alone.
+
+        Args
+        ----
+        dump (PPFDump) : dump to store
+        column (int) : column of the global arrays, and row of the region 
+            numbers and global variables, belonging to the dump
+        """
+        for name, array in dump.parrays.items():
+            matrix = self._pmatrix.get(name)
+            if matrix is not None:
+                matrix[:, column] = array
+                dump.parrays[name] = matrix[:, column]
+
+        self._ireg[column] = dump.IREG
+        dump.IREG = self._ireg[column]
+        self._globals[column] = dump.global_variables
+        dump.global_variables = self._globals[column]
 
     def validate(self):
         """Check to see if there were any problems during parsing of the dump file
@@ -95,7 +349,7 @@ class PPF:
         # Assert that the number of regions matches the expected number
         for dump in self.dumps:
             try:
-                assert len(set(dump.IREG)) == dump.NREG
+                assert np.unique(dump.IREG).size == dump.NREG
             except:
                 errors.append("zone region has been imported incorrectly, \n\
                         --this is an issue when using ioniz--")
@@ -145,18 +399,35 @@ class PPF:
         """
         pass
 
+    def get_globals(self):
+        """Return the global variables of every dump
+
+        Returns
+        -------
+        2D numpy array [float, float]: shape = (dump number, 48), read only, row
+            i is dumps[i].global_variables, in the order documented by step 4 
+            in Appendix IV of the Hyades user manual
+
+        Examples
+        --------
+        >>> dt = dmps.get_globals()[:,0] # time step at every dump
+        """
+        return self._globals
+
     def get_times(self):
         """Return all times corresponding to a dump"
 
         Returns
         -------
-        numpy array [float] :  list of times dumps were made
+        numpy array [float] :  list of times dumps were made, read only, copy it 
+            to change it in place
 
         Examples
         --------
         >>> dmps.get_times()
+        >>> t_ns = dmps.get_times() * 1e9
         """
-        return np.array([dump.TIME for dump in self.dumps])
+        return self._times
 
     def collect(self, array_name):
         """Return all dumps for a given global array
@@ -167,19 +438,18 @@ class PPF:
 
         Returns
         -------
-        2D numpy array [float, float]: shape = (nzones, dump number)
+        2D numpy array [float, float]: shape = (nzones, dump number), this is 
+            the read only array the dumps' parrays are views of, copy it to 
+            change it in place. Dumps that do not contain the array are nan
 
         Examples
         --------
         >>> rcm = dmps.collect("RCM")
         >>> pres = dmps.collect("PRES")
         >>> pres[:,10] # pressure across all zones for the 10th dump
+        >>> pres_gbar = dmps.collect("PRES") * 1e-10
         """
-        array = [] 
-        for dump in self.dumps:
-            array.append(dump.parrays[array_name])
-
-        return np.array(array).T
+        return self._pmatrix[array_name]
 
     @property
     def arrays(self):
@@ -200,28 +470,40 @@ class PPF:
         Find the index of a dump at time, t 
         Args
         ----
-        t (float) : time at which to find the dump index
+        t (float or [float]) : time(s) at which to find the dump index
 
         Returns
         -------
-        int : array index corresponding to dump at time, t
-
-        TODO : Except list of times, and return index list
+        int or numpy array [int] : array index corresponding to dump at time, t
+            or an array of indices if a list of times is given
 
         Examples
         --------
         >>> dmps.tidx(1e-9)
         10
+        >>> dmps.tidx([1e-9, 2e-9])
+        array([10, 20])
         """
-        times = self.get_times()
-        return np.argmin(np.abs(times - t))
+        # Dump times increase monotonically, so bisect for the dumps either 
+        # side of t rather than scanning every time
+        times = self._times
+        t = np.asarray(t, dtype=np.float64)
+        if len(times) < 2:
+            idx = np.zeros(t.shape, dtype=np.intp)
+        else:
+            idx = np.clip(np.searchsorted(times, t), 1, len(times) - 1)
+            # Step back to the earlier dump when it is at least as close
+            idx = idx - ((t - times[idx - 1]) <= (times[idx] - t))
+
+        return idx[()]
 
     @property
     def ireg(self):
         """Return numpy array of region numbers with dimensions matching problem 
-        zones
+        zones, the read only first row of the region numbers stored for every 
+        dump
         """
-        return self.dumps[0].IREG
+        return self._ireg[0]
 
 
 class PPFDump:
@@ -237,10 +519,25 @@ class PPFDump:
     BYTES_PER_ITEM {"str":int} : Dictionary with keys corresponding to data type
         of which a given packet(s) will be converted to, and values as the number 
         of bytes required to represent the given data type.
+    NUMPY_DTYPE {"str":str} : Dictionary with keys corresponding to data type
+        and values as the equivalent little-endian numpy dtype
+    ARRAY_DTYPE {"str":numpy dtype} : Dictionary with keys corresponding to data 
+        type and values as the dtype arrays are returned in. Integers are signed 
+        so arithmetic on e.g. region numbers can go negative
+    SCALAR_FORMAT {"str":struct.Struct} : Dictionary with keys corresponding to 
+        data type and values as precompiled formats for unpacking a single item
+    LAYOUT (str) : names of the fields located by _parse_dump, in the order 
+        their packet offsets are returned
     """
 
     BYTES_PER_PACKET = 4
     BYTES_PER_ITEM = {"s":1, "I":4, "d":8, "f":4}
+    NUMPY_DTYPE = {"I":"<u4", "d":"<f8", "f":"<f4"}
+    ARRAY_DTYPE = {"I":np.int64, "d":np.float64, "f":np.float64}
+    SCALAR_FORMAT = {"I":struct.Struct("<I"), "d":struct.Struct("<d"), 
+            "f":struct.Struct("<f")}
+    LAYOUT = ("NAMEP", "TBUF", "DBUF", "IVER1", "IVER2", "MACHNE", "TIME", 
+            "CPPBUF", "PHGRPBND", "PHGRPCEN", "IREG", "GLOBALS", "PARRAYS")
     GET_ARRAY_SIZE = {
             "R":lambda nzone: (nzone+1), # [1, nmesh + 1]
             "RCM":lambda nzone: (nzone+1) + 1, # [0, nmesh + 1]
@@ -253,49 +550,130 @@ class PPFDump:
             "STRTOT":lambda nzone: (nzone+1) + 1, # [0, nzone+1]
             }
 
-    def __init__(self, f):
+    def __init__(self, buf, cursor, layout=None, parray_packets=None):
         """Read in the five records for each dump
         Appendix IV user guide Version PP.11.xx October, 2013
 
+        The integer fields of the dump are walked by _parse_dump, which gives 
+        the location of every other field; those are then read straight out 
+        of the buffer.
+
         Args
         ----
-        f (binary file) : pointer to the binary file currently being read
+        buf (buffer) : contents of the binary file currently being read, 
+            e.g. a memory map of the file
+        cursor ([int]) : single element list holding the byte offset of the 
+            start of this dump, advanced in place as the dump is read
+        layout (tuple) : (None) result of _parse_dump for this dump, as returned
+            by find_end, walked again if not given
+        parray_packets {str: int} : (None) packets taken by each global array 
+            type, as returned by parray_packets, worked out from this dump's 
+            NZONE if not given
 
         """
-        self._f = f
-
-        self._extract_array_lengths()
-        self._extract_header()
-        self._extract_material_composition()
+        self._buf = buf
+        self._cursor = cursor
+        self._parray_packets = parray_packets
+
+        if layout is None:
+            words = np.frombuffer(buf, dtype=self.NUMPY_DTYPE["I"], 
+                    count=len(buf) // self.BYTES_PER_PACKET)
+            layout = _parse_dump(words, cursor[0] // self.BYTES_PER_PACKET)
+        lengths, header, elements, materials, offsets = layout
+        self._offsets = dict(zip(self.LAYOUT, offsets.tolist()))
+
+        self._extract_array_lengths(lengths)
+        self._extract_header(header)
+        self._extract_material_composition(elements, materials)
         self._extract_global_variables()
         self._extract_global_variable_arrays()
 
-        del self._f
+        del self._buf
+        del self._cursor
+        del self._offsets
+        del self._parray_packets
+
+    @classmethod
+    def find_end(cls, buf, start, parray_packets):
+        """Find where a dump ends by walking its layout, without reading it
+
+        Args
+        ----
+        buf (buffer) : contents of the binary file currently being read
+        start (int) : byte offset of the start of the dump
+        parray_packets {str: int} : packets taken by each global array type, 
+            as returned by parray_packets
+
+        Returns
+        -------
+        int : byte offset of the end of the dump
+        tuple : the layout returned by _parse_dump, to be passed on to PPFDump
+        """
+        words = np.frombuffer(buf, dtype=cls.NUMPY_DTYPE["I"], 
+                count=len(buf) // cls.BYTES_PER_PACKET)
+        layout = _parse_dump(words, start // cls.BYTES_PER_PACKET)
+        lengths, header, elements, materials, offsets = layout
+        offsets = dict(zip(cls.LAYOUT, offsets.tolist()))
 
-    def _extract_packet_values(self, packets, dtype, as_array=False):
+        cppbuf = offsets["CPPBUF"] * cls.BYTES_PER_PACKET
+        nppary = int(header[5])
+        parray_names = buf[cppbuf:cppbuf + 2*nppary*cls.BYTES_PER_PACKET]
+        parray_names = parray_names.decode("utf-8", errors="replace").split()
+
+        end = offsets["PARRAYS"]
+        for parray_name in parray_names:
+            end += 2 + parray_packets.get(parray_name, 0)
+
+        return end * cls.BYTES_PER_PACKET, layout
+
+    @classmethod
+    def parray_packets(cls, nzone):
+        """Number of packets taken by each type of global array in GET_ARRAY_SIZE
+
+        Args
+        ----
+        nzone (int) : number of zones in the problem
+
+        Returns
+        -------
+        {str: int} : packets of doubles for each array name
+        """
+        packets_per_item = cls.BYTES_PER_ITEM["d"] // cls.BYTES_PER_PACKET
+        return {name: packets_per_item*get_size(nzone) 
+                for name, get_size in cls.GET_ARRAY_SIZE.items()}
+
+    def _extract_packet_values(self, offset, packets, dtype, as_array=False):
         """Extract some number of packets from the binary file
 
         Args
         ----
+        offset (int) : packet index to start reading from
         packets (int) : number of packets to be read in
         dtype (str) : data type to convert the bytes to 
-        as_array (bool) : Return the extracted data in numpy array form 
+        as_array (bool) : Return the extracted data in numpy array form, copied
+            out of the buffer so it outlives the file
         """
-        byte_number = packets * self.BYTES_PER_PACKET
-        items = byte_number // self.BYTES_PER_ITEM[dtype]
-        byte_format = "<{}{}".format(items, dtype)
+        start = offset * self.BYTES_PER_PACKET
+
+        # Single values are unpacked directly, only the first item is ever used
+        if not as_array and dtype != "s":
+            return self.SCALAR_FORMAT[dtype].unpack_from(self._buf, start)[0]
 
-        value =  struct.unpack(byte_format, self._f.read(byte_number))
+        byte_number = packets * self.BYTES_PER_PACKET
 
         if dtype == "s":
-            value = list(map(lambda x: x.decode("utf-8"), value))
+            raw = self._buf[start:start + byte_number]
+            if len(raw) != byte_number:
+                raise IndexError("read past the end of the ppf file")
+            return raw.decode("utf-8", errors="replace")
 
-        if not as_array:
-            return value[0]
-        else:
-            return np.array(value)
+        items = byte_number // self.BYTES_PER_ITEM[dtype]
+        value = np.frombuffer(self._buf, dtype=self.NUMPY_DTYPE[dtype], 
+                count=items, offset=start)
+
+        return value.astype(self.ARRAY_DTYPE[dtype])
 
-    def _extract_array_lengths(self):
+    def _extract_array_lengths(self, lengths):
         """Extract the information about the problem for the current dump
 
         Properties
@@ -308,77 +686,54 @@ class PPFDump:
         NRMAXX  - maximum number of regions
         """
 
-        _ = self._extract_packet_values(1, "I", as_array=True)
+        (self.NGRPMXX, self.NIONMXX, self.NLVLMXX, self.NMATMXX, self.NPPARMXX, 
+                self.NTNPARTMXX, self.NTNREACMXX, self.NRMAXX, 
+                self.NZMAXX) = lengths.tolist()
 
-        self.NGRPMXX = self._extract_packet_values(1, "I")
-        self.NIONMXX = self._extract_packet_values(1, "I")
-        self.NLVLMXX = self._extract_packet_values(1, "I")
-        self.NMATMXX = self._extract_packet_values(1, "I")
-        self.NPPARMXX = self._extract_packet_values(1, "I")
-        self.NTNPARTMXX = self._extract_packet_values(1, "I")
-        self.NTNREACMXX = self._extract_packet_values(1, "I")
-        self.NRMAXX = self._extract_packet_values(1, "I")
-        self.NZMAXX = self._extract_packet_values(1, "I")
-
-        # Unsure why this is necessary
-        _ = self._extract_packet_values(2, "I", as_array=True)
-
-    def _extract_header(self):
+    def _extract_header(self, header):
         """Extract the header for this specific dump
         """
 
-        self.NAMEP = self._extract_packet_values(8, "s")
-        self.TBUF = self._extract_packet_values(2, "s")
-        self.DBUF = self._extract_packet_values(2, "s")
-        _ = self._extract_packet_values(1, "I")
-        self.IVER1 = self._extract_packet_values(2, "s")
-        self.IVER2 = self._extract_packet_values(2, "s")
-        self.MACHNE = self._extract_packet_values(2, "s")
-        self.TIME = self._extract_packet_values(2, "d")
-        self.NCYCL = self._extract_packet_values(1, "I")
-        self.IALPHA = self._extract_packet_values(1, "I")
-        self.NREG = self._extract_packet_values(1, "I")
-        self.NZONE = self._extract_packet_values(1, "I")
-        self.NGROUP = self._extract_packet_values(1, "I")
-        _ = self._extract_packet_values(5, "I")
-        self.NPPARY = self._extract_packet_values(1, "I")
-        _ = self._extract_packet_values(8, "I")
-
-        self.CPPBUF = self._extract_packet_values(2*self.NPPARY, "s")
+        offsets = self._offsets
+
+        self.NAMEP = self._extract_packet_values(offsets["NAMEP"], 8, "s")
+        self.TBUF = self._extract_packet_values(offsets["TBUF"], 2, "s")
+        self.DBUF = self._extract_packet_values(offsets["DBUF"], 2, "s")
+        self.IVER1 = self._extract_packet_values(offsets["IVER1"], 2, "s")
+        self.IVER2 = self._extract_packet_values(offsets["IVER2"], 2, "s")
+        self.MACHNE = self._extract_packet_values(offsets["MACHNE"], 2, "s")
+        self.TIME = self._extract_packet_values(offsets["TIME"], 2, "d")
+        (self.NCYCL, self.IALPHA, self.NREG, self.NZONE, self.NGROUP, 
+                self.NPPARY) = header.tolist()
+
+        self.CPPBUF = self._extract_packet_values(
+                offsets["CPPBUF"], 2*self.NPPARY, "s")
         self.parray_names = self.CPPBUF.split()
-        _ = self._extract_packet_values(2*(self.NPPARMXX-self.NPPARY), "s")
 
-        self.PHGRPBND = self._extract_packet_values(self.NGRPMXX, "f", as_array=True)
-        self.PHGRPCEN = self._extract_packet_values(self.NGRPMXX, "f", as_array=True)
+        self.PHGRPBND = self._extract_packet_values(
+                offsets["PHGRPBND"], self.NGRPMXX, "f", as_array=True)
+        self.PHGRPCEN = self._extract_packet_values(
+                offsets["PHGRPCEN"], self.NGRPMXX, "f", as_array=True)
 
-    def _extract_material_composition(self):
+    def _extract_material_composition(self, elements, materials):
         """Extract the material composition for the problem
 
         TODO : Fix problem with importing photon groups
         """
 
-        # Might be 2 4byte buffer, and 1 4 byte package belongs to PHGRPBND
-        _ = self._extract_packet_values(3, "I", as_array=True)
-
         # Get region numbers
-        self.IREG = self._extract_packet_values(self.NZONE, "I", as_array=True)
-
-
-        _ = self._extract_packet_values(1, "I")
+        self.IREG = self._extract_packet_values(self._offsets["IREG"], 
+                self.NZONE, "I", as_array=True)
 
         self._materials = {}
 
-        for region in range(1,self.NREG+1):
-            elements = self._extract_packet_values(1, "I")
-            self._materials[region] = []
-            # Number of elements
-            for element in range(elements):
-                # Atomic Fraction, atomic number, atomic weight
-                self._materials[region].append({
-                        "atmfrc":self._extract_packet_values(2, "d"),
-                        "atmnum":self._extract_packet_values(2, "d"),
-                        "atmwgt":self._extract_packet_values(2, "d")
-                        })
+        for region, (count, offset) in enumerate(
+                zip(elements.tolist(), materials.tolist()), 1):
+            # Atomic Fraction, atomic number, atomic weight for each element
+            values = self._extract_packet_values(offset, 6*count, "d", as_array=True)
+            self._materials[region] = [
+                    {"atmfrc":atmfrc, "atmnum":atmnum, "atmwgt":atmwgt}
+                    for atmfrc, atmnum, atmwgt in values.reshape(count, 3).tolist()]
 
     def _extract_global_variables(self):
         """Extract all parameters and global variables for the problem at this 
@@ -399,7 +754,8 @@ class PPFDump:
 
         TODO : Convert this to a dictionary with the global_variables as keys
         """
-        self.global_variables = self._extract_packet_values(48*2, "d", as_array=True)
+        self.global_variables = self._extract_packet_values(
+                self._offsets["GLOBALS"], 48*2, "d", as_array=True)
 
     def _extract_global_variable_arrays(self):
         """Extract all arrays the user requested be dumped
@@ -407,20 +763,26 @@ class PPFDump:
 
         assert len(self.parray_names) == self.NPPARY
 
-        _ = self._extract_packet_values(2, "d")
+        offset = self._offsets["PARRAYS"]
+        parray_packets = self._parray_packets
+        if parray_packets is None:
+            parray_packets = self.parray_packets(self.NZONE)
 
         self.parrays = {}
 
         for parray_name in self.parray_names:
-            _ = self._extract_packet_values(2, "d")
-            try:
-                parray_size = self.GET_ARRAY_SIZE[parray_name](self.NZONE)
-            except:
+            offset += 2
+            packets = parray_packets.get(parray_name)
+            if packets is None:
                 print("Was not able to calculate size of {} type array,\n \
                         add it to the list".format(parray_name))
-            else:
-                self.parrays[parray_name] = self._extract_packet_values(    
-                    2*parray_size, "d", as_array=True)
+                continue
+
+            self.parrays[parray_name] = self._extract_packet_values(    
+                offset, packets, "d", as_array=True)
+            offset += packets
+
+        self._cursor[0] = offset * self.BYTES_PER_PACKET
 
 class PArray:
 
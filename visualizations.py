@@ -15,16 +15,22 @@
     on the extracted information
 """
 
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 
-def animate(xarray, yarray, tarray=None):
+def animate(xarray, yarray, tarray=None, xlim=None, ylim=None):
     """Generate and animation of of two hyades arrays for each timestep
 
     Args
     ----
     xarray (collected array from pyades dumps) : shape=(nzones,times) X array to plot
     yarray (collected array from pyades dumps) : shape=(nzones,times) Y array to plot
+    tarray ([float]) : (None) dump times, printed on the animation if given
+    xlim ((float, float)) : (None) x axis limits, the full range of xarray, 
+        ignoring nans, if not given
+    ylim ((float, float)) : (None) y axis limits, the full range of yarray, 
+        ignoring nans, if not given
 
     Examples
     --------
@@ -35,31 +41,28 @@ def animate(xarray, yarray, tarray=None):
     Make start, stop, step, and restart commands into buttons
     """
 
-    def update_animation(t, line, xdata, ydata, tdata=None):
+    def update_animation(t, line, text, xdata, ydata, tdata=None):
         """Update the animation to the next frame 
+
+        Only the returned artists are redrawn, the rest of the figure is 
+        blitted from the cached background
+
         Args
         ----
         t (int) : index of frame count
         line
-        xdata
-        ydata
+        text
+        xdata : shape=(times,nzones), each frame is a contiguous row
+        ydata : shape=(times,nzones), each frame is a contiguous row
         tdata
         """
-        line.set_data(xdata[:,t], ydata[:,t])
+        line.set_data(xdata[t], ydata[t])
 
         # Write the time step to the figure
         if tdata is not None:
-            text_str = "time: {:.2E} ns".format(tdata[t]*1e9)
-            fig = line.get_figure()
-            texts = fig.texts
-
-            if len(texts) != 0:
-                texts[0].set_text(text_str)
-            else:
-                plt.figtext(0,0, text_str)
+            text.set_text("time: {:.2E} ns".format(tdata[t]*1e9))
 
-        plt.draw()
-        return line,
+        return line, text
 
     if not plt.isinteractive():
         print("Turning interactive mode on")
@@ -67,15 +70,28 @@ def animate(xarray, yarray, tarray=None):
 
     fig = plt.figure()
     ax = fig.add_subplot(111)
-    plt.ylim(yarray.min(), yarray.max())
-    plt.xlim(xarray.min(), xarray.max())
+    # fmin and fmax ignore nans, and reduce over every axis without copying
+    if ylim is None:
+        ylim = (np.fmin.reduce(yarray, axis=None), 
+                np.fmax.reduce(yarray, axis=None))
+    if xlim is None:
+        xlim = (np.fmin.reduce(xarray, axis=None), 
+                np.fmax.reduce(xarray, axis=None))
+    plt.ylim(*ylim)
+    plt.xlim(*xlim)
 
     line, = ax.plot(xarray[:,0], yarray[:,0])
+    text = ax.text(0, 0, "", transform=ax.transAxes)
     frame_count = len(xarray[0,1:])
+
+    # Store the frames time-major so each one is read as a contiguous row 
+    # rather than a strided column
+    xdata = np.ascontiguousarray(xarray[:,1:].T)
+    ydata = np.ascontiguousarray(yarray[:,1:].T)
     ani = animation.FuncAnimation(
             fig, update_animation, frame_count, 
-            fargs=(line, xarray[:,1:], yarray[:,1:], tarray), 
-            repeat=True, interval=10)
+            fargs=(line, text, xdata, ydata, tarray), 
+            repeat=True, interval=10, blit=True)
 
 
     plt.show()
@@ -94,12 +110,18 @@ def animate(xarray, yarray, tarray=None):
 
 def plot_with_ireg(xdata, ydata, ireg):
     """Plot with indicators of the different regions in the problem 
+
+    Zones of a region are contiguous in Hyades, so each region is plotted from 
+    a slice between the points where the region number changes
     """
     fig = plt.figure()
     ax = fig.add_subplot(111)
-    for reg in set(ireg):
-        reg_xdata = xdata[ireg==reg]
-        reg_ydata = ydata[ireg==reg]
+    changes = np.flatnonzero(np.diff(ireg)) + 1
+    starts = np.r_[0, changes]
+    ends = np.r_[changes, len(ireg)]
+    for start, end in zip(starts, ends):
+        reg_xdata = xdata[start:end]
+        reg_ydata = ydata[start:end]
         l = ax.plot(reg_xdata, reg_ydata)
         ax.fill_between(reg_xdata, 0, reg_ydata, alpha=.5)
 